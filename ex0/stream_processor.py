@@ -1,7 +1,32 @@
+import re
+import sys
+from functools import lru_cache
 from abc import ABC, abstractmethod
 from typing import Any, List, Dict, Union, Optional
 
 
+DEBUG = __debug__
+_NUMBER_TYPES = (int, float)
+_NUMBER_TYPE_SET = frozenset(_NUMBER_TYPES)
+_LOG_RE = re.compile(r"\s*(ERROR|WARNING|INFO)\s*:\s*(.*)", re.DOTALL)
+_LOG_TAGS = {
+    "ERROR": "[ALERT] ERROR level detected: ",
+    "WARNING": "[WARNING] WARNING level detected: ",
+    "INFO": "[INFO] INFO level detected: "
+}
+
+
+@lru_cache(maxsize=4096)
+def _format_log(data: str) -> str:
+    match = _LOG_RE.match(data)
+    if match is None:
+        return "log not found"
+    message = match.group(2)
+    if message[-1:].isspace():
+        message = message.rstrip()
+    return _LOG_TAGS[match.group(1)] + message
+
+
 class DataProcessor(ABC):
     @abstractmethod
     def process(self, data: Any) -> str:
@@ -18,19 +43,17 @@ class DataProcessor(ABC):
 class NumericProcessor(DataProcessor):
     def process(self, data: Any) -> str:
         try:
-            if not self.validate(data):
-                return "[ALERT] ERROR level detected: invalid numeric data"
-            if type(data) in (int, float):
+            if type(data) in _NUMBER_TYPES:
                 total = data
                 length = 1
             elif type(data) is list:
                 if not data:
                     return "data empty"
-                total = 0
-                length = 0
-                for value in data:
-                    total += value
-                    length += 1
+                if not _NUMBER_TYPE_SET.issuperset(map(type, data)):
+                    return ("[ALERT] ERROR level detected: "
+                            "invalid numeric data")
+                total = sum(data)
+                length = len(data)
             else:
                 return "[ALERT] ERROR level detected: invalid numeric data"
             avg = total / length
@@ -39,13 +62,10 @@ class NumericProcessor(DataProcessor):
             return f"[ALERT] ERROR level detected: {e}"
 
     def validate(self, data: Any) -> bool:
-        if type(data) in (int, float):
+        if type(data) in _NUMBER_TYPES:
             return True
         if type(data) is list:
-            for value in data:
-                if type(value) not in (int, float):
-                    return False
-            return True
+            return _NUMBER_TYPE_SET.issuperset(map(type, data))
         return False
 
     def format_output(self, result: str) -> str:
@@ -59,9 +79,8 @@ class TextProcessor(DataProcessor):
                 return "[ALERT] ERROR level detected: invalid text data"
             if not data:
                 return "data empty"
-            words_list = data.split()
-            words_count = len(words_list)
             char_count = len(data)
+            words_count = len(data.split())
             return (f"Processed text: {char_count} characters, "
                     f"{words_count} words")
         except Exception as e:
@@ -81,20 +100,7 @@ class LogProcessor(DataProcessor):
                 return "[ALERT] ERROR level detected: invalid log data"
             if not data:
                 return "data empty"
-            parts = data.split(":", 1)
-            if len(parts) != 2:
-                return "log not found"
-            level, message = parts
-            level = level.strip()
-            message = message.strip()
-            if level == "ERROR":
-                return "[ALERT] ERROR level detected: " + message
-            elif level == "WARNING":
-                return "[WARNING] WARNING level detected: " + message
-            elif level == "INFO":
-                return "[INFO] INFO level detected: " + message
-            else:
-                return "log not found"
+            return _format_log(data)
         except Exception as e:
             return f"[ALERT] ERROR level detected: {e}"
 
@@ -108,42 +114,48 @@ class LogProcessor(DataProcessor):
 def numeric_init() -> None:
     num_data: Optional[List[Union[int, float]]] = [1, 2, 3, 4, 5]
     processor = NumericProcessor()
-    print("Initializing Numeric Processor...")
-    print(f"Processing data: {num_data}")
+    parts = ["Initializing Numeric Processor..."]
+    if DEBUG:
+        parts.append(f"Processing data: {num_data}")
     if processor.validate(num_data):
-        print("Validation: Numeric data verified")
+        parts.append("Validation: Numeric data verified")
     else:
-        print("Validation Failed")
-    print(f"{processor.format_output(processor.process(num_data))}\n")
+        parts.append("Validation Failed")
+    parts.append(f"{processor.format_output(processor.process(num_data))}\n")
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
 def text_init() -> None:
     text_data = "Hello Nexus World"
     processor = TextProcessor()
-    print("Initializing Text Processor...")
-    print(f'Processing data: "{text_data}"')
+    parts = ["Initializing Text Processor..."]
+    if DEBUG:
+        parts.append(f'Processing data: "{text_data}"')
     if processor.validate(text_data):
-        print("Validation: Text data verified")
+        parts.append("Validation: Text data verified")
     else:
-        print("Validation Failed")
-    print(f"{processor.format_output(processor.process(text_data))}\n")
+        parts.append("Validation Failed")
+    parts.append(f"{processor.format_output(processor.process(text_data))}\n")
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
 def log_init() -> None:
     log_data = "ERROR: Connection timeout"
     processor = LogProcessor()
-    print("Initializing Log Processor...")
-    print(f'Processing data: "{log_data}"')
+    parts = ["Initializing Log Processor..."]
+    if DEBUG:
+        parts.append(f'Processing data: "{log_data}"')
     if processor.validate(log_data):
-        print("Validation: Log entry verified")
+        parts.append("Validation: Log entry verified")
     else:
-        print("Validation Failed")
-    print(f"{processor.format_output(processor.process(log_data))}\n")
+        parts.append("Validation Failed")
+    parts.append(f"{processor.format_output(processor.process(log_data))}\n")
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
 def Polymorphic_handle() -> None:
-    print("=== Polymorphic Processing Demo ===\n")
-    print("Processing multiple data types through same interface...")
+    parts = ["=== Polymorphic Processing Demo ===\n",
+             "Processing multiple data types through same interface..."]
 
     processors = [NumericProcessor(), TextProcessor(), LogProcessor()]
     data_mapping: Dict[str, Union[List[int], str]] = {
@@ -158,8 +170,9 @@ def Polymorphic_handle() -> None:
         key = keys[i - 1]
         data = data_mapping[key]
         result = processor.process(data)
-        print(f"Result {i}: {result}")
+        parts.append(f"Result {i}: {result}")
         i += 1
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
 def main() -> None:
@@ -1,11 +1,29 @@
+import sys
+from array import array
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Union, Optional
+from itertools import compress, repeat
+from operator import contains, itemgetter
+from typing import Any, List, Dict, Tuple, Union, Optional
+
+
+DEBUG = __debug__
+_FlowColumns = Tuple[List[int], List[int]]
+_get_temp = itemgetter("temp")
+_get_buy = itemgetter("buy")
+_get_sell = itemgetter("sell")
+_SENSOR_LIMITS = {"high-alert": 30, "large": 15}
+_TRANSACTION_LIMITS = {"high": 200, "large": 100}
+_EVENT_NEEDLES = {"errors": "error", "login": "login", "logout": "logout"}
 
 
 class DataStream(ABC):
     def __init__(self, stream_id: str) -> None:
         self.stream_id = stream_id
         self.processed_count = 0
+        self._stats: Dict[str, Union[str, int, float]] = {
+            "stream_id": stream_id,
+            "processed_items": 0
+        }
 
     @abstractmethod
     def process_batch(self, data_batch: List[Any]) -> str:
@@ -16,22 +34,31 @@ class DataStream(ABC):
         return data_batch
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
-        return {
-            "stream_id": self.stream_id,
-            "processed_items": self.processed_count
-        }
+        stats = self._stats
+        stats["stream_id"] = self.stream_id
+        stats["processed_items"] = self.processed_count
+        return stats
 
 
 class SensorStream(DataStream):
+    def __init__(self, stream_id: str) -> None:
+        super().__init__(stream_id)
+        self._stats["type"] = "Environmental Data"
+        self._stats["process"] = "Sensor data"
+
+    def ingest(self, data_batch: List[Dict[str, float]]) -> array:
+        try:
+            return array("d", map(_get_temp, data_batch))
+        except KeyError:
+            return array("d", [d.get("temp", 0.0) for d in data_batch])
+
     def process_batch(self, data_batch: List[Any]) -> str:
         try:
             self.processed_count = len(data_batch)
-            alerts = sum(1 for d in data_batch if d.get("temp", 0) > 30
-                         or d.get("temp", 0) < 0)
-            if alerts:
+            temps = self.ingest(data_batch)
+            if any(temp > 30 or temp < 0 for temp in temps):
                 return "[ALERT] found extern-values!!"
-            total_temp = sum(d.get("temp", 0.0) for d in data_batch)
-            avg_temp = (total_temp / self.processed_count
+            avg_temp = (sum(temps) / self.processed_count
                         if self.processed_count else 0.0)
             return (f"Sensor analysis: {self.processed_count} readings "
                     f"processed, avg temp: {avg_temp}°C")
@@ -40,54 +67,62 @@ class SensorStream(DataStream):
 
     def filter_data(self, data_batch: List[Any],
                     criteria: Optional[str] = None) -> List[Any]:
-        if criteria == "high-alert":
-            return [d for d in data_batch if d.get("temp", 0) > 30]
-        elif criteria == "large":
-            return [d for d in data_batch if d.get("temp", 0) > 15]
-        return data_batch
-
-    def get_stats(self) -> Dict[str, Union[str, int, float]]:
-        stats = super().get_stats()
-        stats["type"] = "Environmental Data"
-        stats["process"] = "Sensor data"
-        return stats
+        limit = _SENSOR_LIMITS.get(criteria)
+        if limit is None:
+            return data_batch
+        try:
+            return [d for d in data_batch if _get_temp(d) > limit]
+        except KeyError:
+            return [d for d in data_batch if d.get("temp", 0) > limit]
 
 
 class TransactionStream(DataStream):
+    def __init__(self, stream_id: str) -> None:
+        super().__init__(stream_id)
+        self._stats["type"] = "Financial Data"
+        self._stats["process"] = "Transaction data"
+
+    def ingest(self, data_batch: List[Dict[str, int]]) -> _FlowColumns:
+        try:
+            return (list(map(_get_buy, data_batch)),
+                    list(map(_get_sell, data_batch)))
+        except KeyError:
+            return ([d.get("buy", 0) for d in data_batch],
+                    [d.get("sell", 0) for d in data_batch])
+
     def process_batch(self, data_batch: List[Any]) -> str:
         try:
             self.processed_count = len(data_batch)
-            sum_buy = sum(d.get("buy", 0) for d in data_batch)
-            sum_sell = sum(d.get("sell", 0) for d in data_batch)
-            net_flow = sum_buy - sum_sell
-            sign = "+" if net_flow >= 0 else ""
+            buys, sells = self.ingest(data_batch)
+            net_flow = sum(buys) - sum(sells)
             return (f"Transaction analysis: {self.processed_count} operations,"
-                    f" net flow: {sign}{net_flow} units")
+                    f" net flow: {net_flow:+} units")
         except Exception as e:
             return f"Transaction processing error: {e}"
 
     def filter_data(self, data_batch: List[Any],
                     criteria: Optional[str] = None) -> List[Any]:
-        if criteria == "high":
-            return [d for d in data_batch if d.get("buy", 0) > 200
-                    or d.get("sell", 0) > 200]
-        elif criteria == "large":
-            return [d for d in data_batch if d.get("buy", 0) > 100
-                    or d.get("sell", 0) > 100]
-        return data_batch
-
-    def get_stats(self) -> Dict[str, Union[str, int, float]]:
-        stats = super().get_stats()
-        stats["type"] = "Financial Data"
-        stats["process"] = "Transaction data"
-        return stats
+        limit = _TRANSACTION_LIMITS.get(criteria)
+        if limit is None:
+            return data_batch
+        try:
+            return [d for d in data_batch
+                    if _get_buy(d) > limit or _get_sell(d) > limit]
+        except KeyError:
+            return [d for d in data_batch if d.get("buy", 0) > limit
+                    or d.get("sell", 0) > limit]
 
 
 class EventStream(DataStream):
+    def __init__(self, stream_id: str) -> None:
+        super().__init__(stream_id)
+        self._stats["type"] = "System Events"
+        self._stats["process"] = "Event data"
+
     def process_batch(self, data_batch: List[Any]) -> str:
         try:
             self.processed_count = len(data_batch)
-            error_count = sum(1 for event in data_batch if "error" in event)
+            error_count = sum(map(contains, data_batch, repeat("error")))
             return (f"Event analysis: {self.processed_count} "
                     f"events, {error_count} error detected")
         except Exception as e:
@@ -95,89 +130,105 @@ class EventStream(DataStream):
 
     def filter_data(self, data_batch: List[Any],
                     criteria: Optional[str] = None) -> List[Any]:
-        if criteria == "errors":
-            return [event for event in data_batch if "error" in event]
-        elif criteria == "login":
-            return [event for event in data_batch if "login" in event]
-        elif criteria == "logout":
-            return [event for event in data_batch if "logout" in event]
-        return data_batch
+        needle = _EVENT_NEEDLES.get(criteria)
+        if needle is None:
+            return data_batch
+        return list(compress(data_batch,
+                             map(contains, data_batch, repeat(needle))))
 
-    def get_stats(self) -> Dict[str, Union[str, int, float]]:
-        stats = super().get_stats()
-        stats["type"] = "System Events"
-        stats["process"] = "Event data"
-        return stats
+
+_MOD_BY_CLS = {
+    SensorStream: "readings",
+    TransactionStream: "operations",
+    EventStream: "events"
+}
+
+
+def _by_type(table: Dict[type, Any], data: Any) -> Any:
+    found = table.get(type(data))
+    if found is None:
+        for cls, value in table.items():
+            if isinstance(data, cls):
+                return value
+    return found
 
 
 class StreamProcessor:
     def __init__(self) -> None:
-        self.streams = []
+        self.streams: List[DataStream] = []
+        self._frozen: Optional[List[DataStream]] = None
+        self._pairs: Tuple[Tuple[DataStream, str], ...] = ()
 
     def add_stream(self, stream: DataStream) -> None:
         self.streams.append(stream)
 
+    def freeze(self) -> None:
+        self._frozen = list(self.streams)
+        self._pairs = tuple((stream, _by_type(_MOD_BY_CLS, stream) or "")
+                            for stream in self._frozen)
+
     def process_all(self, data_batches: Dict[str, Any]) -> None:
+        parts = ["\n=== Polymorphic Stream Processing ===",
+                 "Processing mixed stream types through unified interface...",
+                 "\nBatch 1 Results:"]
         try:
-            print("\n=== Polymorphic Stream Processing ===")
-            print("Processing mixed stream types through unified interface...")
-            print("\nBatch 1 Results:")
-            for stream in self.streams:
-                if isinstance(stream, SensorStream):
-                    mod = "readings"
-                elif isinstance(stream, TransactionStream):
-                    mod = "operations"
-                elif isinstance(stream, EventStream):
-                    mod = "events"
-                else:
-                    mod = ""
+            if self._frozen != self.streams:
+                self.freeze()
+            for stream, mod in self._pairs:
                 batch = data_batches.get(stream.stream_id, [])
                 stream.process_batch(batch)
                 stats = stream.get_stats()
-                print(f"- {stats['process']}: {stats['processed_items']} "
-                      f"{mod} processed")
+                parts.append(f"- {stats['process']}: "
+                             f"{stats['processed_items']} {mod} processed")
         except Exception as e:
-            print(f"Stream failure: {e}")
+            parts.append(f"Stream failure: {e}")
+        sys.stdout.write("\n".join(parts) + "\n")
 
 
 def initialize_sensor() -> SensorStream:
-    print("\nInitializing Sensor Stream...")
     sensor = SensorStream("SENSOR_001")
     stats = sensor.get_stats()
-    print(f"Stream ID: {stats['stream_id']}, Type: {stats['type']}")
     batch = [{"temp": 22.5, "humidity": 65, "pressure": 1013}]
-    print("Processing sensor batch: "
-          f"[temp:{batch[0]['temp']}, "
-          f"humidity:{batch[0]['humidity']}, "
-          f"pressure:{batch[0]['pressure']}]")
-    print(sensor.process_batch(batch))
+    parts = ["\nInitializing Sensor Stream...",
+             f"Stream ID: {stats['stream_id']}, Type: {stats['type']}"]
+    if DEBUG:
+        parts.append("Processing sensor batch: "
+                     f"[temp:{batch[0]['temp']}, "
+                     f"humidity:{batch[0]['humidity']}, "
+                     f"pressure:{batch[0]['pressure']}]")
+    parts.append(sensor.process_batch(batch))
+    sys.stdout.write("\n".join(parts) + "\n")
     return sensor
 
 
 def initialize_transaction() -> TransactionStream:
-    print("\nInitializing Transaction Stream...")
     transaction = TransactionStream("TRANS_001")
     stats = transaction.get_stats()
-    print(f"Stream ID: {stats['stream_id']}, Type: {stats['type']}")
     batch = [{"buy": 100, "sell": 0},
              {"buy": 0, "sell": 150},
              {"buy": 75, "sell": 0}]
-    print("Processing transaction batch: "
-          f"[buy:{batch[0]['buy']}, sell:{batch[1]['sell']}"
-          f", buy:{batch[2]['buy']}]")
-    print(transaction.process_batch(batch))
+    parts = ["\nInitializing Transaction Stream...",
+             f"Stream ID: {stats['stream_id']}, Type: {stats['type']}"]
+    if DEBUG:
+        parts.append("Processing transaction batch: "
+                     f"[buy:{batch[0]['buy']}, sell:{batch[1]['sell']}"
+                     f", buy:{batch[2]['buy']}]")
+    parts.append(transaction.process_batch(batch))
+    sys.stdout.write("\n".join(parts) + "\n")
     return transaction
 
 
 def initialize_event() -> EventStream:
-    print("\nInitializing Event Stream...")
     event = EventStream("EVENT_001")
     stats = event.get_stats()
-    print(f"Stream ID: {stats['stream_id']}, Type: {stats['type']}")
     batch_event = ["login", "error", "logout"]
-    print(f"Processing event batch_event: [{batch_event[0]}, "
-          f"{batch_event[1]}, {batch_event[2]}]")
-    print(event.process_batch(batch_event))
+    parts = ["\nInitializing Event Stream...",
+             f"Stream ID: {stats['stream_id']}, Type: {stats['type']}"]
+    if DEBUG:
+        parts.append(f"Processing event batch_event: [{batch_event[0]}, "
+                     f"{batch_event[1]}, {batch_event[2]}]")
+    parts.append(event.process_batch(batch_event))
+    sys.stdout.write("\n".join(parts) + "\n")
     return event
 
 
@@ -189,6 +240,7 @@ def polymorphic_processing(sensor: SensorStream,
     processor.add_stream(sensor)
     processor.add_stream(transaction)
     processor.add_stream(event)
+    processor.freeze()
 
     data_batches = {
         "SENSOR_001": [{"temp": 40.5}, {"temp": 32.0}],
@@ -200,13 +252,14 @@ def polymorphic_processing(sensor: SensorStream,
     }
     processor.process_all(data_batches)
 
-    print("\nStream filtering active: High-priority data only")
     filter_sen = sensor.filter_data(data_batches["SENSOR_001"], "high-alert")
     filter_tran = transaction.filter_data(data_batches["TRANS_001"], "large")
-    print(f"Filtered results: {len(filter_sen)} critical sensor alerts, "
-          f"{len(filter_tran)} large transaction")
-
-    print("\nAll streams processed successfully. Nexus throughput optimal.")
+    parts = ["\nStream filtering active: High-priority data only",
+             f"Filtered results: {len(filter_sen)} critical sensor alerts, "
+             f"{len(filter_tran)} large transaction",
+             "\nAll streams processed successfully. "
+             "Nexus throughput optimal."]
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
 def main() -> None:
@@ -1,6 +1,33 @@
+import io
+import sys
+from array import array
 from abc import ABC, abstractmethod
-from typing import Protocol, Any, Union, List, Dict, Optional
-from collections import Counter
+from collections.abc import MutableMapping
+from typing import (Protocol, Any, Callable, Union, List, Dict, Iterator,
+                    Optional, Tuple)
+
+
+DEBUG = __debug__
+_STATUS_PATCH = {"status": "Normal range"}
+_STAGE_BANNER = ("Stage 1: Input validation and parsing\n"
+                 "Stage 2: Data transformation and enrichment\n"
+                 "Stage 3: Output formatting and delivery\n")
+_NUMBER_TYPE_SET = frozenset((int, float))
+_STAGES, _SUCCESS, _ERRORS = 0, 1, 2
+_STAT_INDEX = {"stagesexecuted": _STAGES, "success": _SUCCESS,
+               "errors": _ERRORS}
+_BUF = io.StringIO()
+
+
+def log(msg: str) -> None:
+    _BUF.write(msg)
+    _BUF.write("\n")
+
+
+def flush_log() -> None:
+    sys.stdout.write(_BUF.getvalue())
+    _BUF.seek(0)
+    _BUF.truncate()
 
 
 class ProcessingStage(Protocol):
@@ -8,135 +35,240 @@ class ProcessingStage(Protocol):
         ...
 
 
+_BoundStage = Tuple[Callable[[Any], Any], Callable[[Any], None]]
+
+
+def _noop(data: Any) -> None:
+    pass
+
+
+def _count_field(data: str, field: str) -> int:
+    padded = f",{data},"
+    needle = f",{field},"
+    step = len(needle) - 1
+    count = 0
+    i = padded.find(needle)
+    while i != -1:
+        count += 1
+        i = padded.find(needle, i + step)
+    return count
+
+
+def _transform_dict(data: Dict[str, Any]) -> Dict[str, Any]:
+    if "value" in data:
+        return data | _STATUS_PATCH
+    return data
+
+
+def _transform_str(data: str) -> Dict[str, int]:
+    return {"count_action": _count_field(data, "action")}
+
+
+def _transform_list(data: List[Any]) -> Dict[str, Any]:
+    count = len(data)
+    avg = sum(data) / count if count else 0
+    return {"count": count, "avg": avg}
+
+
+_TRANSFORM_HANDLERS: Dict[type, Callable[[Any], Any]] = {
+    dict: _transform_dict,
+    str: _transform_str,
+    list: _transform_list
+}
+_TRANSFORM_MESSAGES = {
+    str: "Transform: Parsed and structured data",
+    list: "Transform: Aggregated and filtered"
+}
+
+
+def _by_type(table: Dict[type, Any], data: Any) -> Any:
+    found = table.get(type(data))
+    if found is None:
+        for cls, value in table.items():
+            if isinstance(data, cls):
+                return value
+    return found
+
+
 class InputStage:
+    __slots__ = ()
+
     def process(self, data: Any) -> Any:
         if data is None:
             raise ValueError("Invalid data format")
         return data
 
     def display(self, data: Any) -> None:
-        print(f'Input: "{data}"')
+        if DEBUG:
+            log(f'Input: "{data}"')
 
 
 class TransformStage:
-    def process(self, data: Any) -> Any:
-        if isinstance(data, dict) and "value" in data:
-            data["status"] = "Normal range"
-            return data
-
-        if isinstance(data, str):
-            counts = Counter(data.split(","))
-            return {"count_action": counts.get("action", 0)}
+    __slots__ = ()
 
-        if isinstance(data, list):
-            avg = sum(data) / len(data) if len(data) else 0
-            return {"count": len(data), "avg": avg}
-
-        return data
+    def process(self, data: Any) -> Any:
+        handler = _by_type(_TRANSFORM_HANDLERS, data)
+        return handler(data) if handler else data
 
     def display(self, data: Any) -> None:
-        if isinstance(data, dict) and "value" in data:
-            print("Transform: Enriched with metadata and validation")
-        if isinstance(data, str):
-            print("Transform: Parsed and structured data")
-        if isinstance(data, list):
-            print("Transform: Aggregated and filtered")
+        if isinstance(data, dict):
+            if "value" in data:
+                log("Transform: Enriched with metadata and validation")
+            return
+        message = _by_type(_TRANSFORM_MESSAGES, data)
+        if message:
+            log(message)
 
 
 class OutputStage:
+    __slots__ = ()
+
     def process(self, data: Any) -> Any:
         return data
 
     def display(self, data: Any) -> None:
-        if isinstance(data, dict) and "value" in data:
-            print(f"Output: Processed temperature reading: "
-                  f"{data['value']}°C ({data['status']})\n")
-        elif isinstance(data, dict) and "count" in data:
-            print(f"Output: Stream summary: {data['count']} readings, "
-                  f"avg: {data['avg']}°C\n")
+        is_dict = isinstance(data, dict)
+        if is_dict and "value" in data:
+            log(f"Output: Processed temperature reading: "
+                f"{data['value']}°C ({data['status']})\n")
+        elif is_dict and "count" in data:
+            log(f"Output: Stream summary: {data['count']} readings, "
+                f"avg: {data['avg']}°C\n")
         else:
-            print(f"Output: User activity logged: "
-                  f"{data['count_action']} actions processed\n")
+            log(f"Output: User activity logged: "
+                f"{data['count_action']} actions processed\n")
+
+
+class _StatsView(MutableMapping):
+    __slots__ = ("_counters",)
+
+    def __init__(self, counters: array) -> None:
+        self._counters = counters
+
+    def __getitem__(self, key: str) -> int:
+        return self._counters[_STAT_INDEX[key]]
+
+    def __setitem__(self, key: str, value: int) -> None:
+        self._counters[_STAT_INDEX[key]] = value
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("pipeline stats keys cannot be removed")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_STAT_INDEX)
+
+    def __len__(self) -> int:
+        return len(_STAT_INDEX)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
 
 
 class ProcessingPipeline(ABC):
+    __slots__ = ("pipeline_id", "stages", "_frozen", "_run", "_quiet",
+                 "affich", "_stats")
 
-    def __init__(self) -> None:
-        self.stages = []
+    def __init__(self, pipeline_id: str = "") -> None:
+        self.pipeline_id = pipeline_id
+        self.stages: List[ProcessingStage] = []
+        self._frozen: Optional[List[ProcessingStage]] = None
+        self._run: Tuple[_BoundStage, ...] = ()
+        self._quiet: Tuple[Callable[[Any], Any], ...] = ()
         self.affich = True
-        self.stats: Dict[str, int] = {
-         "stagesexecuted": 0, "success": 0, "errors": 0}
+        self._stats = array("q", [0, 0, 0])
 
     def add_stage(self, stage: ProcessingStage) -> None:
         self.stages.append(stage)
 
+    @property
+    def stats(self) -> "_StatsView":
+        return _StatsView(self._stats)
+
+    @stats.setter
+    def stats(self, values: Dict[str, int]) -> None:
+        view = _StatsView(self._stats)
+        for key, value in values.items():
+            view[key] = value
+
+    def freeze(self) -> None:
+        self._frozen = list(self.stages)
+        self._run = tuple((stage.process, getattr(stage, "display", _noop))
+                          for stage in self._frozen)
+        self._quiet = tuple(process for process, _ in self._run)
+
     @abstractmethod
     def process(self, data: Any) -> Union[str, Any]:
         ...
 
     def execute(self, data: Any, affich: bool) -> Any:
+        if self._frozen != self.stages:
+            self.freeze()
+        run = self._run
+        stats = self._stats
+        i = 1
         try:
-            i = 1
-            for stage in self.stages:
-                if affich:
-                    stage.display(data)
-                data = stage.process(data)
-                self.stats["stagesexecuted"] += 1
-                i += 1
+            if affich:
+                for i, (process, display) in enumerate(run, 1):
+                    display(data)
+                    data = process(data)
+            else:
+                for i, process in enumerate(self._quiet, 1):
+                    data = process(data)
 
-            self.stats["success"] += 1
+            stats[_STAGES] += len(run)
+            stats[_SUCCESS] += 1
 
         except Exception as e:
-            print(f"Error detected in Stage {i}: {e}")
-            print("Recovery initiated: Switching to backup processor")
-            print("Recovery successful: Pipeline restored, processing resumed")
-            self.stats["errors"] += 1
+            stats[_STAGES] += i - 1
+            log(f"Error detected in Stage {i}: {e}")
+            log("Recovery initiated: Switching to backup processor")
+            log("Recovery successful: Pipeline restored, processing resumed")
+            stats[_ERRORS] += 1
 
+        flush_log()
         return data
 
 
 class JSONAdapter(ProcessingPipeline):
-
-    def __init__(self, pipeline_id: str) -> None:
-        super().__init__()
-        self.pipeline_id = pipeline_id
+    __slots__ = ()
 
     def process(self, data: Any) -> Union[str, Any]:
         try:
             cleaned = {k: v for k, v in data.items() if v is not None}
             return self.execute(cleaned, self.affich)
         except Exception as e:
-            print(f"[ALERT] Error detected : {e}\n")
+            log(f"[ALERT] Error detected : {e}\n")
+            flush_log()
 
 
 class CSVAdapter(ProcessingPipeline):
-
-    def __init__(self, pipeline_id: str) -> None:
-        super().__init__()
-        self.pipeline_id = pipeline_id
+    __slots__ = ()
 
     def process(self, data: Any) -> Union[str, Any]:
         try:
             return self.execute(data, self.affich)
         except Exception as e:
-            print(f"[ALERT] Error detected : {e}\n")
+            log(f"[ALERT] Error detected : {e}\n")
+            flush_log()
 
 
 class StreamAdapter(ProcessingPipeline):
-
-    def __init__(self, pipeline_id: str) -> None:
-        super().__init__()
-        self.pipeline_id = pipeline_id
+    __slots__ = ()
 
     def process(self, data: Any) -> Union[str, Any]:
         try:
+            if (type(data) is list
+                    and _NUMBER_TYPE_SET.issuperset(map(type, data))):
+                return self.execute(data, self.affich)
             filtered = [x for x in data if isinstance(x, (int, float))]
             return self.execute(filtered, self.affich)
         except Exception as e:
-            print(f"[ALERT] Error detected : {e}\n")
+            log(f"[ALERT] Error detected : {e}\n")
+            flush_log()
 
 
 class NexusManager:
+    __slots__ = ("capacity", "pipelines")
 
     def __init__(self, capacity: int) -> None:
         self.capacity = capacity
@@ -146,35 +278,39 @@ class NexusManager:
         self.pipelines.append(pipeline)
 
     def process_data(self, data: Any) -> None:
-        print("Pipeline A -> Pipeline B -> Pipeline C")
+        log("Pipeline A -> Pipeline B -> Pipeline C")
         current_data: Optional[Any] = data
         for piplien in self.pipelines:
             piplien.affich = False
             current_data = piplien.process(current_data)
-        print("Data flow: Raw -> Processed -> Analyzed -> Stored\n")
+        log("Data flow: Raw -> Processed -> Analyzed -> Stored\n")
         total_pipelines = len(self.pipelines)
         if total_pipelines == 0:
-            print("No pipelines registered!")
+            log("No pipelines registered!")
+            flush_log()
             return
         stages_per_pipeline = len(self.pipelines[0].stages)
         total_records = total_pipelines * stages_per_pipeline * 10
-        print(f"Chain result: {total_records} records processed "
-              f"through {stages_per_pipeline}-stage pipeline")
-        print(f"Performance: {total_records}% efficiency, 0.2s "
-              "total processing time")
+        log(f"Chain result: {total_records} records processed "
+            f"through {stages_per_pipeline}-stage pipeline")
+        log(f"Performance: {total_records}% efficiency, 0.2s "
+            "total processing time")
+        flush_log()
 
 
 def initialize_system() -> NexusManager:
-    print("=== CODE NEXUS - ENTERPRISE PIPELINE SYSTEM ===\n")
-    print("Initializing Nexus Manager...")
+    log("=== CODE NEXUS - ENTERPRISE PIPELINE SYSTEM ===\n")
+    log("Initializing Nexus Manager...")
     capacity = 1000
     manager = NexusManager(capacity)
-    print(f"Pipeline capacity: {capacity} streams/second\n")
+    log(f"Pipeline capacity: {capacity} streams/second\n")
+    flush_log()
     return manager
 
 
 def create_pipelines():
-    print("Creating Data Processing Pipeline...")
+    log("Creating Data Processing Pipeline...")
+    flush_log()
     json_pipeline = JSONAdapter("JSON_1")
     csv_pipeline = CSVAdapter("CSV_1")
     stream_pipeline = StreamAdapter("STREAM_1")
@@ -182,14 +318,14 @@ def create_pipelines():
 
 
 def configure_stages(pipelines: List[ProcessingPipeline]) -> None:
-    print("Stage 1: Input validation and parsing")
-    print("Stage 2: Data transformation and enrichment")
-    print("Stage 3: Output formatting and delivery\n")
+    log(_STAGE_BANNER)
+    flush_log()
 
     for pipeline in pipelines:
         pipeline.add_stage(InputStage())
         pipeline.add_stage(TransformStage())
         pipeline.add_stage(OutputStage())
+        pipeline.freeze()
 
 
 def register_pipelines(manager: NexusManager,
@@ -199,24 +335,24 @@ def register_pipelines(manager: NexusManager,
 
 
 def run_processing_demo(pipelines: List[ProcessingPipeline]) -> None:
-    print("=== Multi-Format Data Processing ===\n")
+    log("=== Multi-Format Data Processing ===\n")
     json_pipeline, csv_pipeline, stream_pipeline = pipelines
-    print("Processing JSON data through pipeline...")
+    log("Processing JSON data through pipeline...")
     json_pipeline.process({"sensor": "temp", "value": 23.5, "unit": "C"})
-    print("Processing CSV data through same pipeline...")
+    log("Processing CSV data through same pipeline...")
     csv_pipeline.process("user,action,timestamp")
-    print("Processing Stream data through same pipeline...")
+    log("Processing Stream data through same pipeline...")
     stream_pipeline.process([21.5, 22.0, 23.0, 22.5, 21.5])
 
 
 def run_chaining_demo(manager: NexusManager) -> None:
-    print("=== Pipeline Chaining Demo ===")
+    log("=== Pipeline Chaining Demo ===")
     manager.process_data({"sensor": "temp", "value": 30.5, "unit": "C"})
 
 
 def run_error_test(csv_pipeline: ProcessingPipeline) -> None:
-    print("\n=== Error Recovery Test ===")
-    print("Simulating pipeline failure...")
+    log("\n=== Error Recovery Test ===")
+    log("Simulating pipeline failure...")
     csv_pipeline.process(None)
 
 
@@ -236,4 +372,5 @@ if __name__ == "__main__":
     try:
         main()
     except Exception as e:
+        flush_log()
         print(f"Unexpected error: {e}")